@@ -0,0 +1,79 @@
+import { describe, it, expect } from '@jest/globals';
+
+// The module-level aiAgent singleton would otherwise require an API key
+jest.mock('../../src/llmClient', () => ({
+  OpenAILlmClient: jest.fn(),
+}));
+
+import { AIAgent, type JobPosting } from '../../src/aiAgent';
+
+describe('AIAgent', () => {
+  const agent = new AIAgent({} as any, { warn: jest.fn(), log: jest.fn() } as any);
+
+  const jobWithDescription = (description: string): JobPosting => ({
+    id: 'job-1',
+    title: 'Engineer',
+    description,
+    createdAt: new Date(),
+  });
+
+  const parseJobSkills = (description: string): string[] =>
+    (agent as any).parseJobSkills(jobWithDescription(description));
+
+  describe('parseJobSkills', () => {
+    it('should report keywords that share a start offset', () => {
+      const skills = parseJobSkills(
+        'Experience with security frameworks and etl processes'
+      );
+
+      expect(skills).toEqual(
+        expect.arrayContaining([
+          'Security Frameworks',
+          'Security',
+          'Etl Processes',
+          'Etl',
+        ])
+      );
+    });
+
+    it('should report keywords nested inside longer ones', () => {
+      const skills = parseJobSkills('Strong unit testing discipline');
+
+      expect(skills).toEqual(
+        expect.arrayContaining(['Unit Testing', 'Testing'])
+      );
+    });
+
+    it('should match plural keywords', () => {
+      const skills = parseJobSkills(
+        'Design APIs over relational databases and deploy microservices to AWS'
+      );
+
+      expect(skills).toEqual(
+        expect.arrayContaining(['Api', 'Database', 'Microservices', 'Aws'])
+      );
+    });
+
+    it('should not match keywords inside other words', () => {
+      const skills = parseJobSkills('Maintain requirements in good order');
+
+      expect(skills).not.toContain('Ts');
+      expect(skills).not.toContain('Ai');
+      expect(skills).not.toContain('Go');
+    });
+
+    it('should not match keywords fused into longer words', () => {
+      const skills = parseJobSkills('RESTful, Dockerized and ReactJS apps');
+
+      expect(skills).not.toContain('Rest');
+      expect(skills).not.toContain('Docker');
+      expect(skills).not.toContain('React');
+    });
+
+    it('should return sorted, de-duplicated skills', () => {
+      const skills = parseJobSkills('React, react and React again; also AWS');
+
+      expect(skills).toEqual(['Aws', 'React']);
+    });
+  });
+});
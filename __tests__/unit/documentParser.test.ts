@@ -0,0 +1,174 @@
+import { describe, it, expect } from '@jest/globals';
+
+// Keep the parser off the filesystem and the OpenAI API
+jest.mock('fs-extra', () => ({
+  ensureDir: jest.fn(() => Promise.resolve()),
+}));
+jest.mock('mammoth', () => ({}));
+jest.mock('../../src/openai', () => ({
+  callOpenAI: jest.fn(),
+}));
+
+import { documentParser, type ParsedCandidate } from '../../src/documentParser';
+
+describe('DocumentParser', () => {
+  const extractBasicInfo = (text: string): ParsedCandidate =>
+    (documentParser as any).extractBasicInfo(text);
+
+  describe('extractBasicInfo name', () => {
+    it.each([
+      ['Name: Jane Doe', 'Jane Doe'],
+      ['Full Name: Jane Doe', 'Jane Doe'],
+      ['Candidate Name: Jane Doe', 'Jane Doe'],
+    ])('should read the name from %p', (line, name) => {
+      expect(extractBasicInfo(`Resume\n${line}\nEngineer`).name).toBe(name);
+    });
+
+    it('should fall back to the first non-blank line', () => {
+      expect(extractBasicInfo('\n\n  Jane Doe\nEngineer').name).toBe(
+        'Jane Doe'
+      );
+    });
+  });
+
+  describe('extractBasicInfo education', () => {
+    it('should match plural degree names', () => {
+      const { education } = extractBasicInfo(
+        'Masters in Computer Science, Bachelors in Math'
+      );
+
+      expect(education).toEqual(['Bachelor', 'Master']);
+    });
+
+    it('should match possessive degree names', () => {
+      const { education } = extractBasicInfo(
+        "Bachelor's degree, Master's degree"
+      );
+
+      expect(education).toEqual(['Bachelor', 'Master']);
+    });
+
+    it('should not match degree abbreviations inside other words', () => {
+      const { education } = extractBasicInfo('Designed the database schema');
+
+      expect(education).toEqual([]);
+    });
+  });
+
+  describe('extractBasicInfo title', () => {
+    it('should match plural title keywords', () => {
+      expect(
+        extractBasicInfo('Enterprise architects and developers').title
+      ).toBe('Developer');
+      expect(extractBasicInfo('Lead developers').title).toBe('Developer');
+    });
+
+    it('should only match whole title keywords', () => {
+      // "Engineering" is not the "Engineer" keyword
+      expect(extractBasicInfo('Software Engineering Manager').title).toBe(
+        'Manager'
+      );
+      expect(extractBasicInfo('Worked on many things').title).toBe(
+        'Professional'
+      );
+    });
+
+    it('should prefer an explicit title line', () => {
+      expect(
+        extractBasicInfo('Job Title: Staff Engineer\nSoftware Engineer').title
+      ).toBe('Staff Engineer');
+    });
+  });
+
+  describe('extractBasicInfo experience', () => {
+    it.each([
+      ['3-5 years in backend roles', '3-5 years'],
+      ['3 to 5 years in backend roles', '3-5 years'],
+      ['5+ years building APIs', '5+ years'],
+      ['Minimum of 3 years with Python', '3+ years'],
+      ['At least 4 years of Go', '4+ years'],
+      ['7 years of experience shipping software', '7 years'],
+    ])('should read %p as %p', (text, experience) => {
+      expect(extractBasicInfo(text).experience).toBe(experience);
+    });
+
+    it('should use the first mention of experience', () => {
+      expect(
+        extractBasicInfo('5+ years of Java, 2 years of experience with Go')
+          .experience
+      ).toBe('5+ years');
+    });
+
+    it('should not read a year range as experience', () => {
+      expect(extractBasicInfo('Acme Corp, 2019-2023 years').experience).toBe(
+        'Unknown'
+      );
+    });
+
+    it('should fall back to Unknown', () => {
+      expect(extractBasicInfo('Seasoned engineer').experience).toBe('Unknown');
+    });
+  });
+
+  describe('extractBasicInfo skills', () => {
+    it('should match plural skill keywords', () => {
+      const { skills } = extractBasicInfo(
+        'Strong communications skills, Redis and Kanban boards'
+      );
+
+      expect(skills).toEqual(['Redis', 'Kanban', 'Communication']);
+    });
+
+    it('should only match whole skill keywords', () => {
+      const { skills } = extractBasicInfo(
+        'Designed RESTful APIs in Java, Dockerized ReactJS apps, C++11'
+      );
+
+      expect(skills).toEqual(['Java']);
+    });
+  });
+
+  describe('parseDocumentsSettled', () => {
+    it('should settle every file in order with bounded concurrency', async () => {
+      let inFlight = 0;
+      let maxInFlight = 0;
+      const parseDocument = jest
+        .spyOn(documentParser, 'parseDocument')
+        .mockImplementation(async (_, originalname) => {
+          inFlight++;
+          maxInFlight = Math.max(maxInFlight, inFlight);
+          await new Promise(resolve => setTimeout(resolve, 1));
+          inFlight--;
+          if (originalname.startsWith('bad')) {
+            throw new Error(`Unreadable ${originalname}`);
+          }
+          return { name: originalname } as ParsedCandidate;
+        });
+      const files = ['a', 'bad-b', 'c', 'd', 'e', 'bad-f', 'g'].map(name => ({
+        path: `/uploads/${name}`,
+        originalname: name,
+      }));
+
+      const results = await documentParser.parseDocumentsSettled(files);
+
+      expect(maxInFlight).toBeLessThanOrEqual(4);
+      expect(
+        results.map(result =>
+          result.status === 'fulfilled'
+            ? result.value.name
+            : (result.reason as Error).message
+        )
+      ).toEqual([
+        'a',
+        'Unreadable bad-b',
+        'c',
+        'd',
+        'e',
+        'Unreadable bad-f',
+        'g',
+      ]);
+
+      parseDocument.mockRestore();
+    });
+  });
+});
@@ -0,0 +1,155 @@
+import { describe, it, expect, beforeEach } from '@jest/globals';
+
+jest.mock('axios', () => ({
+  post: jest.fn(),
+}));
+
+import axios from 'axios';
+import { parseJobDescription, clearJobDescriptionCache } from '../../src/openai';
+
+const mockPost = axios.post as jest.Mock;
+
+const jobDescription = {
+  jobTitle: 'Senior Software Engineer',
+  seniorityLevel: 'Senior',
+  requiredSkills: ['TypeScript', 'Node.js'],
+  yearsOfExperience: '5+',
+  preferredLocation: 'Remote',
+  summary: 'Build and run backend services.',
+};
+
+const respondWith = (content: unknown) => {
+  mockPost.mockResolvedValue({
+    data: { choices: [{ message: { content: JSON.stringify(content) } }] },
+  });
+};
+
+// Long enough to pass the minimum-length check, distinct per index
+const description = (index: number) =>
+  `Senior Software Engineer #${index}: build TypeScript services on Node.js`;
+
+describe('parseJobDescription', () => {
+  beforeEach(() => {
+    process.env.OPENAI_API_KEY = 'test-key';
+    process.env.OPENAI_PROJECT_ID = 'test-project';
+    mockPost.mockReset();
+    clearJobDescriptionCache();
+    respondWith(jobDescription);
+  });
+
+  it('should parse a job description into a frozen result', async () => {
+    const parsed = await parseJobDescription(description(0));
+
+    expect(parsed).toEqual(jobDescription);
+    expect(Object.isFrozen(parsed)).toBe(true);
+    expect(Object.isFrozen(parsed.requiredSkills)).toBe(true);
+  });
+
+  it('should accept a numeric yearsOfExperience', async () => {
+    respondWith({ ...jobDescription, yearsOfExperience: 5 });
+
+    const parsed = await parseJobDescription(description(0));
+
+    expect(parsed.yearsOfExperience).toBe('5');
+  });
+
+  it('should accept null for details the description leaves out', async () => {
+    respondWith({
+      ...jobDescription,
+      seniorityLevel: null,
+      yearsOfExperience: null,
+      preferredLocation: null,
+      summary: null,
+    });
+
+    const parsed = await parseJobDescription(description(0));
+
+    expect(parsed).toEqual({
+      ...jobDescription,
+      seniorityLevel: '',
+      yearsOfExperience: '',
+      preferredLocation: '',
+      summary: '',
+    });
+  });
+
+  it('should cache a result with a null location', async () => {
+    respondWith({ ...jobDescription, preferredLocation: null });
+
+    await parseJobDescription(description(0));
+    const parsed = await parseJobDescription(description(0));
+
+    expect(parsed.preferredLocation).toBe('');
+    expect(mockPost).toHaveBeenCalledTimes(1);
+  });
+
+  describe('input validation', () => {
+    it.each([
+      ['empty input', ''],
+      ['short input', 'Engineer, remote'],
+      [
+        'input with no letters up front',
+        `${'0123456789 '.repeat(10)}Engineer`,
+      ],
+    ])('should reject %s without calling OpenAI', async (_, input) => {
+      await expect(parseJobDescription(input)).rejects.toThrow(
+        'too short or has no text'
+      );
+      expect(mockPost).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('cache', () => {
+    it('should call OpenAI once for a repeated description', async () => {
+      const first = await parseJobDescription(description(0));
+      const second = await parseJobDescription(description(0));
+
+      expect(mockPost).toHaveBeenCalledTimes(1);
+      expect(second).toBe(first);
+    });
+
+    it('should call OpenAI again after the cache is cleared', async () => {
+      await parseJobDescription(description(0));
+      clearJobDescriptionCache();
+      await parseJobDescription(description(0));
+
+      expect(mockPost).toHaveBeenCalledTimes(2);
+    });
+
+    it.each([
+      ['null', null],
+      ['an error object', { error: 'rate limited' }],
+      ['missing fields', { jobTitle: 'Engineer' }],
+    ])('should reject and not cache %s', async (_, content) => {
+      respondWith(content);
+
+      await expect(parseJobDescription(description(0))).rejects.toThrow(
+        'did not match the expected shape'
+      );
+
+      respondWith(jobDescription);
+      await expect(parseJobDescription(description(0))).resolves.toEqual(
+        jobDescription
+      );
+      expect(mockPost).toHaveBeenCalledTimes(2);
+    });
+
+    it('should evict the least recently used description when full', async () => {
+      for (let index = 0; index < 4096; index++) {
+        await parseJobDescription(description(index));
+      }
+      // Touch the oldest entry so the next one becomes least recently used
+      await parseJobDescription(description(0));
+      expect(mockPost).toHaveBeenCalledTimes(4096);
+
+      await parseJobDescription(description(4096));
+      expect(mockPost).toHaveBeenCalledTimes(4097);
+
+      await parseJobDescription(description(0));
+      expect(mockPost).toHaveBeenCalledTimes(4097);
+
+      await parseJobDescription(description(1));
+      expect(mockPost).toHaveBeenCalledTimes(4098);
+    });
+  });
+});
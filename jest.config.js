@@ -68,7 +68,9 @@ export default {
   
   // Module name mapping
   moduleNameMapper: {
-    '^@/(.*)$': '<rootDir>/src/$1'
+    '^@/(.*)$': '<rootDir>/src/$1',
+    // ESM-style relative imports in src/ ('./openai.js') resolve to the .ts source
+    '^(\\.{1,2}/.*)\\.js$': '$1'
   },
   
   // Clear mocks between tests
@@ -14,6 +14,7 @@ import {
   SemanticSearchService,
   type SemanticAnalysis,
 } from './semanticSearch.js';
+import { keywordAlternation } from './textMatching.js';
 import { z } from 'zod';
 
 export interface Candidate {
@@ -56,6 +57,153 @@ export interface AnalysisConfig {
   focus: 'technical' | 'business' | 'balanced';
 }
 
+// Common skill keywords with variations, looked for in job descriptions
+const jobSkillKeywords = [
+  'javascript',
+  'js',
+  'react',
+  'vue',
+  'angular',
+  'css',
+  'html',
+  'typescript',
+  'ts',
+  'node.js',
+  'nodejs',
+  'python',
+  'java',
+  'c#',
+  'csharp',
+  'go',
+  'golang',
+  'database',
+  'sql',
+  'nosql',
+  'mongodb',
+  'postgresql',
+  'mysql',
+  'redis',
+  'api',
+  'rest',
+  'graphql',
+  'microservices',
+  'authentication',
+  'auth',
+  'security',
+  'testing',
+  'unit testing',
+  'integration testing',
+  'docker',
+  'kubernetes',
+  'k8s',
+  'aws',
+  'azure',
+  'gcp',
+  'cloud',
+  'ci/cd',
+  'cicd',
+  'terraform',
+  'monitoring',
+  'infrastructure as code',
+  'iac',
+  'machine learning',
+  'ml',
+  'ai',
+  'artificial intelligence',
+  'data analysis',
+  'statistics',
+  'pandas',
+  'numpy',
+  'data visualization',
+  'big data',
+  'etl processes',
+  'etl',
+  'a/b testing',
+  'ab testing',
+  'product strategy',
+  'market research',
+  'user experience design',
+  'ux',
+  'ui',
+  'stakeholder management',
+  'product roadmap',
+  'customer research',
+  'business metrics',
+  'competitive analysis',
+  'business strategy',
+  'market analysis',
+  'financial modeling',
+  'project management',
+  'risk assessment',
+  'compliance knowledge',
+  'regulatory compliance',
+  'risk management',
+  'audit processes',
+  'policy development',
+  'data governance',
+  'security frameworks',
+  'compliance monitoring',
+  'regulatory reporting',
+  'internal controls',
+  'compliance training',
+  'team leadership',
+  'strategic planning',
+  'resource management',
+  'performance management',
+  'stakeholder communication',
+  'change management',
+  'process improvement',
+  'budget management',
+  'strategic decision making',
+  'figma',
+  'adobe',
+  'prototyping',
+  'design systems',
+  'user research',
+  'agile',
+  'scrum',
+  'kanban',
+  'jira',
+  'confluence',
+];
+
+// Properly capitalized display name for each skill keyword, built once so
+// every parse returns the same shared strings
+const jobSkillNames = new Map(
+  jobSkillKeywords.map(keyword => {
+    const skillName = keyword
+      .split(' ')
+      .map(word => word.charAt(0).toUpperCase() + word.slice(1))
+      .join(' ');
+    return [keyword, skillName] as const;
+  })
+);
+
+// Shorter keywords that are word-bounded prefixes of a longer one, e.g.
+// "security" for "security frameworks". The scan below only reports the
+// longest keyword starting at each offset, so these are added alongside it.
+const jobSkillPrefixes = new Map(
+  jobSkillKeywords.map(keyword => {
+    const prefixes = jobSkillKeywords.filter(
+      shorter =>
+        shorter.length < keyword.length &&
+        keyword.startsWith(shorter) &&
+        !/[a-z0-9]/.test(keyword.charAt(shorter.length))
+    );
+    return [keyword, prefixes] as const;
+  })
+);
+
+// All skill keywords in one pass over the text. The match is wrapped in a
+// lookahead so keywords starting at different offsets (e.g. "unit testing"
+// and "testing") are each reported; keywords sharing a start offset are
+// covered by jobSkillPrefixes. An optional trailing "s" lets plurals such
+// as "APIs" and "databases" match their keyword.
+const jobSkillPattern = new RegExp(
+  `(?=(?<![a-z0-9])(${keywordAlternation(jobSkillKeywords)})s?(?![a-z0-9]))`,
+  'g'
+);
+
 export class AIAgent {
   private defaultConfig: AnalysisConfig = {
     weights: { technical: 0.3, experience: 0.25, skills: 0.25, cultural: 0.2 },
@@ -1484,131 +1632,20 @@ Return valid JSON matching the CulturalFit schema exactly.`;
     const requirements = job.requirements ? job.requirements.toLowerCase() : '';
     const fullText = `${description} ${requirements}`;
 
-    const skills: string[] = [];
-
-    // Common skill keywords with variations
-    const skillKeywords = [
-      'javascript',
-      'js',
-      'react',
-      'vue',
-      'angular',
-      'css',
-      'html',
-      'typescript',
-      'ts',
-      'node.js',
-      'nodejs',
-      'python',
-      'java',
-      'c#',
-      'csharp',
-      'go',
-      'golang',
-      'database',
-      'sql',
-      'nosql',
-      'mongodb',
-      'postgresql',
-      'mysql',
-      'redis',
-      'api',
-      'rest',
-      'graphql',
-      'microservices',
-      'authentication',
-      'auth',
-      'security',
-      'testing',
-      'unit testing',
-      'integration testing',
-      'docker',
-      'kubernetes',
-      'k8s',
-      'aws',
-      'azure',
-      'gcp',
-      'cloud',
-      'ci/cd',
-      'cicd',
-      'terraform',
-      'monitoring',
-      'infrastructure as code',
-      'iac',
-      'machine learning',
-      'ml',
-      'ai',
-      'artificial intelligence',
-      'data analysis',
-      'statistics',
-      'pandas',
-      'numpy',
-      'data visualization',
-      'big data',
-      'etl processes',
-      'etl',
-      'a/b testing',
-      'ab testing',
-      'product strategy',
-      'market research',
-      'user experience design',
-      'ux',
-      'ui',
-      'stakeholder management',
-      'product roadmap',
-      'customer research',
-      'business metrics',
-      'competitive analysis',
-      'business strategy',
-      'market analysis',
-      'financial modeling',
-      'project management',
-      'risk assessment',
-      'compliance knowledge',
-      'regulatory compliance',
-      'risk management',
-      'audit processes',
-      'policy development',
-      'data governance',
-      'security frameworks',
-      'compliance monitoring',
-      'regulatory reporting',
-      'internal controls',
-      'compliance training',
-      'team leadership',
-      'strategic planning',
-      'resource management',
-      'performance management',
-      'stakeholder communication',
-      'change management',
-      'process improvement',
-      'budget management',
-      'strategic decision making',
-      'figma',
-      'adobe',
-      'prototyping',
-      'design systems',
-      'user research',
-      'agile',
-      'scrum',
-      'kanban',
-      'jira',
-      'confluence',
-    ];
-
-    skillKeywords.forEach(keyword => {
-      if (fullText.includes(keyword)) {
-        // Capitalize the skill name properly
-        const skillName = keyword
-          .split(' ')
-          .map(word => word.charAt(0).toUpperCase() + word.slice(1))
-          .join(' ');
-        skills.push(skillName);
+    // Collect distinct keywords straight into a set, so repeated mentions
+    // are not buffered
+    const keywords = new Set<string>();
+    for (const match of fullText.matchAll(jobSkillPattern)) {
+      keywords.add(match[1]);
+      for (const prefix of jobSkillPrefixes.get(match[1]) ?? []) {
+        keywords.add(prefix);
       }
-    });
+    }
 
-    // Remove duplicates and sort
-    return Array.from(new Set(skills)).sort();
+    return Array.from(
+      keywords,
+      keyword => jobSkillNames.get(keyword) ?? keyword
+    ).sort();
   }
 }
 
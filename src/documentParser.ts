@@ -4,6 +4,7 @@ import fs from 'fs-extra';
 import path from 'path';
 import mammoth from 'mammoth';
 import { callOpenAI } from './openai.js';
+import { keywordAlternation } from './textMatching.js';
 
 export interface ParsedCandidate {
   name: string;
@@ -22,6 +23,191 @@ export interface ParsedCandidate {
   rawText: string;
 }
 
+// Skill vocabulary recognised by the fallback parser
+const skillKeywords = [
+  // Programming Languages
+  'JavaScript',
+  'TypeScript',
+  'Python',
+  'Java',
+  'C++',
+  'C#',
+  'PHP',
+  'Ruby',
+  'Go',
+  'Rust',
+  'Swift',
+  'Kotlin',
+  'Scala',
+  // Web Technologies
+  'React',
+  'Vue',
+  'Angular',
+  'Node.js',
+  'Express',
+  'Next.js',
+  'Nuxt.js',
+  'jQuery',
+  'HTML',
+  'CSS',
+  'Sass',
+  'Less',
+  // Databases
+  'MongoDB',
+  'PostgreSQL',
+  'MySQL',
+  'SQLite',
+  'Redis',
+  'Elasticsearch',
+  'DynamoDB',
+  'Cassandra',
+  // Cloud & DevOps
+  'AWS',
+  'Azure',
+  'GCP',
+  'Docker',
+  'Kubernetes',
+  'Terraform',
+  'Jenkins',
+  'GitLab',
+  'GitHub Actions',
+  // Frameworks & Libraries
+  'Django',
+  'Flask',
+  'Spring',
+  'Laravel',
+  'Symfony',
+  'ASP.NET',
+  'FastAPI',
+  'GraphQL',
+  'REST',
+  // Tools & Methodologies
+  'Git',
+  'SVN',
+  'Jira',
+  'Confluence',
+  'Agile',
+  'Scrum',
+  'Kanban',
+  'CI/CD',
+  'TDD',
+  'BDD',
+  // Data & AI
+  'Machine Learning',
+  'Data Science',
+  'TensorFlow',
+  'PyTorch',
+  'Pandas',
+  'NumPy',
+  'Scikit-learn',
+  // Soft Skills
+  'Leadership',
+  'Communication',
+  'Teamwork',
+  'Problem Solving',
+  'Project Management',
+  'Analytical',
+];
+
+// Common job titles, in priority order, used when no explicit title is found
+const commonTitles = [
+  'Software Engineer',
+  'Developer',
+  'Programmer',
+  'Full Stack',
+  'Frontend',
+  'Backend',
+  'DevOps',
+  'Data Scientist',
+  'Product Manager',
+  'Designer',
+  'Architect',
+  'Lead',
+  'Senior',
+  'Junior',
+  'Principal',
+  'Manager',
+  'Director',
+  'VP',
+  'CTO',
+  'CEO',
+];
+
+// Degree and institution keywords recognised by the fallback parser
+const educationKeywords = [
+  'Bachelor',
+  'Master',
+  'PhD',
+  'MBA',
+  'BSc',
+  'MSc',
+  'BA',
+  'MA',
+  'University',
+  'College',
+];
+
+// Fallback extraction patterns, compiled once when the module loads.
+// firstLinePattern stops at the first non-blank line instead of splitting
+// the whole document into lines.
+const firstLinePattern = /^\s*(\S.*)/;
+// The lookbehind only lets a match start at the beginning of a run of
+// local-part characters. Without it a long run with no "@" is rescanned
+// from every offset, which is quadratic in the run length.
+const emailPattern =
+  /(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}/;
+const phonePattern = /\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}/;
+const linkedinPattern = /linkedin\.com\/in\/[a-zA-Z0-9-]+/;
+const githubPattern = /github\.com\/[a-zA-Z0-9-]+/;
+const portfolioPattern =
+  /(?:portfolio|website|personal site)[:\s]+(https?:\/\/[^\s]+)/i;
+// Labelled "Field: value" lines. Anchored per line with the m flag so a
+// label never pairs with text from the following line, and an optional
+// qualifier word covers e.g. "Full Name:", "Job Title:" or
+// "Current Location:"
+const namePattern =
+  /^[ \t]*(?:[a-z]+[ \t]+)?name[ \t]*[: \t][ \t]*([a-zA-Z][a-zA-Z \t]*)/im;
+const titlePattern =
+  /^[ \t]*(?:[a-z]+[ \t]+)?(?:title|position|role)[ \t]*[: \t][ \t]*([^,\r\n]+)/im;
+const locationPattern =
+  /^[ \t]*(?:[a-z]+[ \t]+)?(?:location|address|city)[ \t]*[: \t][ \t]*([^,\r\n]+)/im;
+// Every years-of-experience phrasing in one alternation (lowercase input)
+const experiencePattern =
+  /(?<!\d)(?:(?<lo>\d{1,2})\s*(?:-|to)\s*(?<hi>\d{1,2})\s*years?|(?<plus>\d{1,2})\+\s*years?|(?<years>\d{1,2})\s*years?\s+(?:of\s+)?experience)|minimum\s*(?:of\s*)?(?<min>\d{1,2})\s*years?|at\s*least\s*(?<atl>\d{1,2})\s*years?/;
+
+// Skill and title keywords are matched against lowercased text so the
+// engine does not case-fold each character
+const skillIndexes = new Map(
+  skillKeywords.map((skill, index) => [skill.toLowerCase(), index] as const)
+);
+const titleRanks = new Map(
+  commonTitles.map((jobTitle, rank) => [jobTitle.toLowerCase(), rank] as const)
+);
+
+// Education keywords are all single words, checked against the set of
+// words in the text
+const educationNames = new Map(
+  educationKeywords.map(edu => [edu.toLowerCase(), edu] as const)
+);
+const wordPattern = /[a-z]+/g;
+
+// Skill keywords, title keywords and experience phrases fused into one
+// pattern, so a single pass over the lowercased text feeds all three
+// extractors; each match is dispatched on the named group that matched.
+// Keywords may take a plural "s" ("developers", "communications") but
+// otherwise match whole words only, so e.g. REST is not found in "RESTful".
+const keywordScanPattern = new RegExp(
+  [
+    `(?<![a-z0-9])(?:(?<skill>${keywordAlternation(skillIndexes.keys())})|(?<title>${keywordAlternation(titleRanks.keys())}))s?(?![a-z0-9])`,
+    `(?<experience>${experiencePattern.source})`,
+  ].join('|'),
+  'g'
+);
+
+// Upper bound on documents parsed at once by parseDocumentsSettled, so a
+// large batch doesn't fire an unbounded burst of extraction and OpenAI work
+const batchConcurrency = 4;
+
 export class DocumentParser {
   private uploadDir: string;
 
@@ -203,77 +389,66 @@ Return only valid JSON. If a field is not found, use null or empty string as app
 
   private extractBasicInfo(text: string): ParsedCandidate {
     // Enhanced regex-based extraction as fallback
-    const lines = text
-      .split('\n')
-      .map(line => line.trim())
-      .filter(line => line.length > 0);
-
     // Extract name (usually first line or after "Name:" pattern)
-    let name = lines[0] || 'Unknown';
-    const nameMatch = text.match(/(?:name|full name)[:\s]+([a-zA-Z\s]+)/i);
+    const firstLineMatch = firstLinePattern.exec(text);
+    let name = firstLineMatch ? firstLineMatch[1].trim() : 'Unknown';
+    const nameMatch = namePattern.exec(text);
     if (nameMatch) {
       name = nameMatch[1].trim();
     }
 
     // Extract email
-    const emailMatch = text.match(
-      /[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}/
-    );
+    const emailMatch = emailPattern.exec(text);
     const email = emailMatch ? emailMatch[0] : undefined;
 
     // Extract phone
-    const phoneMatch = text.match(/\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}/);
+    const phoneMatch = phonePattern.exec(text);
     const phone = phoneMatch ? phoneMatch[0] : undefined;
 
     // Extract LinkedIn
-    const linkedinMatch = text.match(/linkedin\.com\/in\/[a-zA-Z0-9-]+/);
+    const linkedinMatch = linkedinPattern.exec(text);
     const linkedin = linkedinMatch ? `https://${linkedinMatch[0]}` : undefined;
 
     // Extract GitHub
-    const githubMatch = text.match(/github\.com\/[a-zA-Z0-9-]+/);
+    const githubMatch = githubPattern.exec(text);
     const github = githubMatch ? `https://${githubMatch[0]}` : undefined;
 
     // Extract portfolio/website
-    const portfolioMatch = text.match(
-      /(?:portfolio|website|personal site)[:\s]+(https?:\/\/[^\s]+)/i
-    );
+    const portfolioMatch = portfolioPattern.exec(text);
     const portfolio = portfolioMatch ? portfolioMatch[1] : undefined;
 
+    // Lowercase once; every keyword lookup below shares this copy
+    const lowerText = text.toLowerCase();
+
+    // Scan once for skill keywords, title keywords and the first mention
+    // of years of experience. Skills are a fixed vocabulary, so hits are
+    // flagged by index.
+    const foundSkills = new Uint8Array(skillKeywords.length);
+    let bestTitleRank = commonTitles.length;
+    let experienceGroups: Record<string, string> | undefined;
+    for (const match of lowerText.matchAll(keywordScanPattern)) {
+      const groups = match.groups ?? {};
+      if (groups.skill) {
+        foundSkills[skillIndexes.get(groups.skill)!] = 1;
+      } else if (groups.title) {
+        // Earlier entries in commonTitles take priority wherever they appear
+        const rank = titleRanks.get(groups.title) ?? bestTitleRank;
+        if (rank < bestTitleRank) {
+          bestTitleRank = rank;
+        }
+      } else if (!experienceGroups) {
+        experienceGroups = groups;
+      }
+    }
+
     // Extract title (look for common patterns)
     let title = undefined;
-    const titleMatch = text.match(/(?:title|position|role)[:\s]+([^,\n]+)/i);
+    const titleMatch = titlePattern.exec(text);
     if (titleMatch) {
       title = titleMatch[1].trim();
     } else {
-      // Look for common job titles in the text
-      const commonTitles = [
-        'Software Engineer',
-        'Developer',
-        'Programmer',
-        'Full Stack',
-        'Frontend',
-        'Backend',
-        'DevOps',
-        'Data Scientist',
-        'Product Manager',
-        'Designer',
-        'Architect',
-        'Lead',
-        'Senior',
-        'Junior',
-        'Principal',
-        'Manager',
-        'Director',
-        'VP',
-        'CTO',
-        'CEO',
-      ];
-      for (const jobTitle of commonTitles) {
-        if (text.toLowerCase().includes(jobTitle.toLowerCase())) {
-          title = jobTitle;
-          break;
-        }
-      }
+      // Fall back to the highest-priority common job title in the text
+      title = commonTitles[bestTitleRank];
     }
 
     // If no title found, set a default
@@ -283,118 +458,39 @@ Return only valid JSON. If a field is not found, use null or empty string as app
 
     // Extract location
     let location = undefined;
-    const locationMatch = text.match(
-      /(?:location|address|city)[:\s]+([^,\n]+)/i
-    );
+    const locationMatch = locationPattern.exec(text);
     if (locationMatch) {
       location = locationMatch[1].trim();
     }
 
-    // Extract skills (enhanced list)
-    const skillKeywords = [
-      // Programming Languages
-      'JavaScript',
-      'TypeScript',
-      'Python',
-      'Java',
-      'C++',
-      'C#',
-      'PHP',
-      'Ruby',
-      'Go',
-      'Rust',
-      'Swift',
-      'Kotlin',
-      'Scala',
-      // Web Technologies
-      'React',
-      'Vue',
-      'Angular',
-      'Node.js',
-      'Express',
-      'Next.js',
-      'Nuxt.js',
-      'jQuery',
-      'HTML',
-      'CSS',
-      'Sass',
-      'Less',
-      // Databases
-      'MongoDB',
-      'PostgreSQL',
-      'MySQL',
-      'SQLite',
-      'Redis',
-      'Elasticsearch',
-      'DynamoDB',
-      'Cassandra',
-      // Cloud & DevOps
-      'AWS',
-      'Azure',
-      'GCP',
-      'Docker',
-      'Kubernetes',
-      'Terraform',
-      'Jenkins',
-      'GitLab',
-      'GitHub Actions',
-      // Frameworks & Libraries
-      'Django',
-      'Flask',
-      'Spring',
-      'Laravel',
-      'Symfony',
-      'ASP.NET',
-      'FastAPI',
-      'GraphQL',
-      'REST',
-      // Tools & Methodologies
-      'Git',
-      'SVN',
-      'Jira',
-      'Confluence',
-      'Agile',
-      'Scrum',
-      'Kanban',
-      'CI/CD',
-      'TDD',
-      'BDD',
-      // Data & AI
-      'Machine Learning',
-      'Data Science',
-      'TensorFlow',
-      'PyTorch',
-      'Pandas',
-      'NumPy',
-      'Scikit-learn',
-      // Soft Skills
-      'Leadership',
-      'Communication',
-      'Teamwork',
-      'Problem Solving',
-      'Project Management',
-      'Analytical',
-    ];
-    const skills = skillKeywords.filter(skill =>
-      text.toLowerCase().includes(skill.toLowerCase())
-    );
+    // Extract skills, in vocabulary order
+    const skills = skillKeywords.filter((_, index) => foundSkills[index]);
+
+    // Extract years of experience
+    let experience = 'Unknown';
+    if (experienceGroups) {
+      const { lo, hi, plus, min, atl, years } = experienceGroups;
+      const atLeast = plus ?? min ?? atl;
+      if (lo && hi) {
+        experience = `${lo}-${hi} years`;
+      } else if (atLeast) {
+        experience = `${atLeast}+ years`;
+      } else {
+        experience = `${years} years`;
+      }
+    }
 
-    // Extract education
-    const educationKeywords = [
-      'Bachelor',
-      'Master',
-      'PhD',
-      'MBA',
-      'BSc',
-      'MSc',
-      'BA',
-      'MA',
-      'University',
-      'College',
-    ];
-    const education = educationKeywords.filter(edu =>
-      text.toLowerCase().includes(edu.toLowerCase())
-    );
+    // Extract education by word lookup rather than substring scans, so
+    // e.g. "BA" no longer matches inside "database". A trailing "s" is
+    // allowed for plurals ("Masters"); possessives ("Bachelor's") already
+    // split at the apostrophe.
+    const words = new Set(lowerText.match(wordPattern));
+    const education: string[] = [];
+    for (const [keyword, edu] of educationNames) {
+      if (words.has(keyword) || words.has(`${keyword}s`)) {
+        education.push(edu);
+      }
+    }
 
     return {
       name,
@@ -403,7 +499,7 @@ Return only valid JSON. If a field is not found, use null or empty string as app
       title,
       currentCompany: undefined,
       location,
-      experience: 'Unknown',
+      experience,
       skills,
       education,
       summary: undefined,
@@ -414,25 +510,57 @@ Return only valid JSON. If a field is not found, use null or empty string as app
     };
   }
 
+  async parseDocumentsSettled(
+    files: Array<{ path: string; originalname: string }>
+  ): Promise<PromiseSettledResult<ParsedCandidate>[]> {
+    const results: PromiseSettledResult<ParsedCandidate>[] = new Array(
+      files.length
+    );
+    let nextIndex = 0;
+
+    // Each worker pulls the next unparsed file until the batch is drained,
+    // so at most batchConcurrency documents are in flight at once
+    const worker = async (): Promise<void> => {
+      while (nextIndex < files.length) {
+        const index = nextIndex++;
+        const file = files[index];
+        try {
+          results[index] = {
+            status: 'fulfilled',
+            value: await this.parseDocument(file.path, file.originalname),
+          };
+        } catch (reason) {
+          results[index] = { status: 'rejected', reason };
+        }
+      }
+    };
+
+    await Promise.all(
+      Array.from({ length: Math.min(batchConcurrency, files.length) }, worker)
+    );
+
+    return results;
+  }
+
   async parseMultipleDocuments(
     files: Array<{ path: string; originalname: string }>
   ): Promise<ParsedCandidate[]> {
-    const results: ParsedCandidate[] = [];
+    const results = await this.parseDocumentsSettled(files);
+    const parsed: ParsedCandidate[] = [];
 
-    for (const file of files) {
-      try {
-        const candidate = await this.parseDocument(
-          file.path,
-          file.originalname
+    for (const [index, result] of results.entries()) {
+      if (result.status === 'fulfilled') {
+        parsed.push(result.value);
+      } else {
+        console.error(
+          `Error parsing ${files[index].originalname}:`,
+          result.reason
         );
-        results.push(candidate);
-      } catch (error) {
-        console.error(`Error parsing ${file.originalname}:`, error);
         // Continue with other files even if one fails
       }
     }
 
-    return results;
+    return parsed;
   }
 
   getUploadDir(): string {
@@ -2,16 +2,19 @@
 
 import axios from 'axios';
 import * as dotenv from 'dotenv';
+import { JobDescriptionSchema } from './schemas.js';
 
 dotenv.config();
 
+// Parsed results are cached and shared between callers, so they are
+// read-only and frozen once parsed
 interface JobDescription {
-  jobTitle: string;
-  seniorityLevel: string;
-  requiredSkills: string[];
-  yearsOfExperience: string;
-  preferredLocation: string;
-  summary: string;
+  readonly jobTitle: string;
+  readonly seniorityLevel: string;
+  readonly requiredSkills: readonly string[];
+  readonly yearsOfExperience: string;
+  readonly preferredLocation: string;
+  readonly summary: string;
 }
 
 interface Candidate {
@@ -53,9 +56,36 @@ export async function callOpenAI(
   return response.data.choices[0].message.content;
 }
 
+// Parsed job descriptions keyed by the raw description text, so re-runs,
+// retries and duplicate postings don't pay for another completion
+const jobDescriptionCacheSize = 4096;
+const jobDescriptionCache = new Map<string, JobDescription>();
+const minJobDescriptionLength = 50;
+
+export function clearJobDescriptionCache(): void {
+  jobDescriptionCache.clear();
+}
+
 export async function parseJobDescription(
   description: string
 ): Promise<JobDescription> {
+  // Reject input that can't be a job description before spending a
+  // completion on it
+  if (
+    description.length < minJobDescriptionLength ||
+    !/[a-zA-Z]/.test(description.slice(0, 100))
+  ) {
+    throw new Error('❌ Job description is too short or has no text to parse');
+  }
+
+  const cached = jobDescriptionCache.get(description);
+  if (cached) {
+    // Re-insert to mark as most recently used
+    jobDescriptionCache.delete(description);
+    jobDescriptionCache.set(description, cached);
+    return cached;
+  }
+
   const promptTemplate = `
 You are an AI recruiter assistant. Parse the following job description and extract structured data for use in automated sourcing.
 
@@ -74,7 +104,29 @@ Return only valid JSON:
 `;
 
   const result = await callOpenAI(promptTemplate);
-  return JSON.parse(result);
+  // Only a well-formed result is frozen and cached; anything else (null,
+  // an error object, missing fields) would otherwise be served to every
+  // later caller with the same description
+  const validated = JobDescriptionSchema.safeParse(JSON.parse(result));
+  if (!validated.success) {
+    throw new Error(
+      `❌ Job description response did not match the expected shape: ${validated.error.message}`
+    );
+  }
+  const parsed: JobDescription = Object.freeze({
+    ...validated.data,
+    requiredSkills: Object.freeze(validated.data.requiredSkills),
+  });
+
+  if (jobDescriptionCache.size >= jobDescriptionCacheSize) {
+    const oldest = jobDescriptionCache.keys().next().value;
+    if (oldest !== undefined) {
+      jobDescriptionCache.delete(oldest);
+    }
+  }
+  jobDescriptionCache.set(description, parsed);
+
+  return parsed;
 }
 
 export async function generateOutreach(
@@ -30,6 +30,25 @@ export const CulturalFitSchema = z.object({
   recommendations: z.array(z.string()),
 });
 
+// Models return null for details a job description leaves out (most
+// often the location); those become empty strings rather than failures
+const optionalText = z
+  .string()
+  .nullable()
+  .transform(value => value ?? '');
+
+export const JobDescriptionSchema = z.object({
+  jobTitle: z.string(),
+  seniorityLevel: optionalText,
+  requiredSkills: z.array(z.string()),
+  yearsOfExperience: z
+    .union([z.string(), z.number().transform(String)])
+    .nullable()
+    .transform(value => value ?? ''),
+  preferredLocation: optionalText,
+  summary: optionalText,
+});
+
 export type AlignmentScore = z.infer<typeof AlignmentScoreSchema>;
 export type SkillsGap = z.infer<typeof SkillsGapSchema>;
 export type CulturalFit = z.infer<typeof CulturalFitSchema>;
@@ -221,12 +221,17 @@ app.post(
       const candidates: any[] = [];
       const errors: string[] = [];
 
-      for (const file of req.files as Express.Multer.File[]) {
+      // Parse uploads a few at a time, then create candidates in upload order
+      const files = req.files as Express.Multer.File[];
+      const parsed = await documentParser.parseDocumentsSettled(files);
+
+      for (const [index, file] of files.entries()) {
         try {
-          const candidate = await documentParser.parseDocument(
-            file.path,
-            file.originalname
-          );
+          const result = parsed[index];
+          if (result.status === 'rejected') {
+            throw result.reason;
+          }
+          const candidate = result.value;
 
           const newCandidate = await databaseService.createCandidate({
             name: candidate.name,
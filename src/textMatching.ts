@@ -0,0 +1,13 @@
+// src/textMatching.ts
+
+/**
+ * Escape keywords and join them into a regex alternation. Longer keywords
+ * come first so that e.g. "javascript" is preferred over "java" when both
+ * could match at the same position.
+ */
+export function keywordAlternation(keywords: Iterable<string>): string {
+  return [...keywords]
+    .sort((a, b) => b.length - a.length)
+    .map(keyword => keyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'))
+    .join('|');
+}